@@ -9,16 +9,127 @@ import logging
 import os
 import platform
 import sys
-from typing import Any, Dict, List, Optional
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-
-class ResolveAPI:
-    """Class to handle connection and interaction with DaVinci Resolve API."""
+# The DaVinciResolveScript module never changes for the lifetime of the
+# process, so it is imported once and shared by every ResolveAPI instance.
+_DVR_SCRIPT_MODULE: Optional[ModuleType] = None
+
+# The Resolve app handle from scriptapp() is likewise shared so repeat
+# constructions reuse the existing bridge instead of re-handshaking.
+_RESOLVE_APP_CACHE = None
+
+
+def _windows_script_api_paths() -> List[str]:
+    """Build the scripting API search paths for Windows."""
+    resolve_script_dir = os.path.join(
+        os.environ.get("PROGRAMDATA", "C:\\ProgramData"),
+        "Blackmagic Design",
+        "DaVinci Resolve",
+        "Support",
+        "Developer",
+        "Scripting",
+    )
+    return [os.path.join(resolve_script_dir, "Modules")]
+
+
+def _darwin_script_api_paths() -> List[str]:
+    """Build the scripting API search paths for macOS (system-wide, then user)."""
+    return [
+        "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",
+        os.path.join(
+            os.path.expanduser("~"),
+            "Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",
+        ),
+    ]
+
+
+def _linux_script_api_paths() -> List[str]:
+    """Build the scripting API search paths for Linux."""
+    return ["/opt/resolve/Developer/Scripting/Modules"]
+
+
+# How long cached media-storage listings stay valid, in seconds.
+_STORAGE_CACHE_TTL = 2.0
+
+
+@lru_cache(maxsize=256)
+def _storage_listing(media_storage, kind: str, folder_path: Optional[str], bucket: int) -> tuple:
+    """
+    Fetch a media-storage listing, memoized per time bucket.
+
+    The bucket argument rolls over every _STORAGE_CACHE_TTL seconds, so
+    repeat calls within a bucket are served from the cache instead of
+    re-scanning storage inside Resolve. Lives at module level (keyed on the
+    session-shared media_storage handle) so the cache is not tied to any one
+    ResolveAPI instance.
+
+    Args:
+        media_storage: The media storage handle to query.
+        kind (str): One of "volumes", "subfolders", or "files".
+        folder_path (Optional[str]): The folder to list, if applicable.
+        bucket (int): The current TTL bucket.
+
+    Returns:
+        tuple: The listing as an immutable snapshot.
+    """
+    if kind == "volumes":
+        return tuple(media_storage.GetMountedVolumes())
+    if kind == "subfolders":
+        return tuple(media_storage.GetSubFolders(folder_path))
+    return tuple(media_storage.GetFiles(folder_path))
+
+
+# Pages that Resolve's OpenPage accepts, mapping the casefolded form to one
+# interned canonical string so every call passes the same cached object
+# across the bridge instead of a fresh lowercased allocation.
+_PAGE_CANON = {
+    page: sys.intern(page) for page in ("media", "edit", "fusion", "color", "fairlight", "deliver")
+}
+
+# Path builders per operating system, resolved lazily since the Windows entry
+# reads PROGRAMDATA and the macOS entries expand the user's home directory.
+_PLATFORM_PATHS = {
+    "Windows": _windows_script_api_paths,
+    "Darwin": _darwin_script_api_paths,
+    "Linux": _linux_script_api_paths,
+}
+
+# The platform is immutable for the lifetime of the process, so the candidate
+# directories are specialized once at import time; the connect path itself
+# carries no platform branching.
+_SYSTEM = platform.system()
+_SCRIPT_API_PATHS: tuple = tuple(_PLATFORM_PATHS[_SYSTEM]()) if _SYSTEM in _PLATFORM_PATHS else ()
+
+
+# Handle attributes shared through the process-wide session rather than being
+# stored per ResolveAPI instance.
+_SESSION_ATTRS = frozenset(
+    {"resolve", "fusion", "project_manager", "current_project", "media_storage", "media_pool"}
+)
+
+
+class _ResolveSession:
+    """
+    Process-wide holder for the Resolve handles.
+
+    MCP dispatchers sometimes construct a ResolveAPI per request; keeping the
+    handles here means every instance shares one connected session instead of
+    re-discovering the handles on each construction.
+    """
+
+    _instance: Optional["_ResolveSession"] = None
+    _lock = threading.Lock()
 
     def __init__(self):
-        """Initialize the ResolveAPI class and connect to DaVinci Resolve."""
         self.resolve = None
         self.fusion = None
         self.project_manager = None
@@ -26,101 +137,143 @@ class ResolveAPI:
         self.media_storage = None
         self.media_pool = None
 
-        self._connect_to_resolve()
+    @classmethod
+    def get(cls) -> "_ResolveSession":
+        """Get the shared session, creating it on first use."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the shared session so the next ResolveAPI rebuilds it."""
+        with cls._lock:
+            cls._instance = None
+
+
+class ResolveAPI:
+    """Class to handle connection and interaction with DaVinci Resolve API.
+
+    Instances are thin façades over the shared _ResolveSession; the handle
+    attributes (resolve, fusion, project_manager, current_project,
+    media_storage, media_pool) read and write session state.
+    """
+
+    def __init__(self):
+        """Initialize the ResolveAPI class and connect to DaVinci Resolve."""
+        self._session = _ResolveSession.get()
+
+        # Cached project/media-pool handles are considered fresh for this many
+        # seconds; mutating methods reset the timestamps to force a re-fetch.
+        self._handle_cache_ttl = 0.25
+        self._project_cache_ts = 0.0
+        self._media_pool_cache_ts = 0.0
+
+        # State for coalescing batched media pool imports.
+        self._import_lock = threading.Lock()
+        self._pending_import_paths: List[str] = []
+        self._pending_import_futures: List[Future] = []
+        self._import_timer: Optional[threading.Timer] = None
+
+        # Single worker on purpose: Resolve's scripting API is not thread-safe,
+        # so async submissions stay serialized while callers are unblocked.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="resolve-api")
+
+        # Only the first instance per session performs the connect handshake.
+        if self._session.resolve is None:
+            self._connect_to_resolve()
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails; forwards the shared handle
+        # attributes to the session without touching other lookups.
+        if name in _SESSION_ATTRS:
+            return getattr(self.__dict__["_session"], name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name, value):
+        if name in _SESSION_ATTRS:
+            setattr(self._session, name, value)
+        else:
+            object.__setattr__(self, name, value)
 
     def _connect_to_resolve(self) -> None:
         """
         Connect to DaVinci Resolve based on the current operating system.
 
-        This function adds the appropriate paths to sys.path and imports the
-        DaVinciResolveScript module to establish a connection to Resolve.
-        """
-        # Determine the appropriate path based on the operating system
-        if platform.system() == "Windows":
-            resolve_script_dir = os.path.join(
-                os.environ.get("PROGRAMDATA", "C:\\ProgramData"),
-                "Blackmagic Design",
-                "DaVinci Resolve",
-                "Support",
-                "Developer",
-                "Scripting",
-            )
-            script_api_path = os.path.join(resolve_script_dir, "Modules")
-
-            # Add the API directory to the system path
-            if script_api_path not in sys.path:
-                sys.path.append(script_api_path)
-
-            # Import the DaVinciResolveScript module
+        The first connection adds the appropriate paths to sys.path and imports
+        the DaVinciResolveScript module; the imported module is cached at module
+        scope so later ResolveAPI instances skip the path setup entirely.
+        """
+        global _DVR_SCRIPT_MODULE, _RESOLVE_APP_CACHE
+
+        if _DVR_SCRIPT_MODULE is None:
+            # Probe the candidate directories for the module file and add only
+            # the first match to sys.path, so there is a single import attempt
+            # instead of failed imports that stat-walk all of sys.path. The
+            # snapshot keeps the membership check O(1) on long paths.
+            known_paths = set(sys.path)
+            for script_api_path in _SCRIPT_API_PATHS:
+                if os.path.exists(os.path.join(script_api_path, "DaVinciResolveScript.py")):
+                    if script_api_path not in known_paths:
+                        sys.path.append(script_api_path)
+                    break
+
+            # Import the DaVinciResolveScript module; this is attempted even
+            # without a probe hit since the module may already be importable
+            # from elsewhere on sys.path.
             try:
                 import DaVinciResolveScript as dvr_script
 
-                self.resolve = dvr_script.scriptapp("Resolve")
+                _DVR_SCRIPT_MODULE = dvr_script
             except ImportError:
-                logger.error("Could not find DaVinciResolveScript module on Windows.")
-                self.resolve = None
+                logger.error("Could not find DaVinciResolveScript module on %s.", _SYSTEM)
 
-        elif platform.system() == "Darwin":
-            # macOS path
-            resolve_script_dir = (
-                "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting"
-            )
-            script_api_path = os.path.join(resolve_script_dir, "Modules")
+        if _RESOLVE_APP_CACHE is None and _DVR_SCRIPT_MODULE is not None:
+            _RESOLVE_APP_CACHE = _DVR_SCRIPT_MODULE.scriptapp("Resolve")
+        self.resolve = _RESOLVE_APP_CACHE
 
-            # Add the API directory to the system path
-            if script_api_path not in sys.path:
-                sys.path.append(script_api_path)
+        # Initialize other components if Resolve is connected; media storage
+        # and Fusion are fetched lazily on first use instead.
+        if self.resolve:
+            (
+                self.project_manager,
+                self.current_project,
+                self.media_pool,
+            ) = self._bootstrap_handles()
 
-            # Import the DaVinciResolveScript module
-            try:
-                import DaVinciResolveScript as dvr_script
+    def _bootstrap_handles(self):
+        """
+        Fetch the project-level Resolve handles in one pass after connecting.
 
-                self.resolve = dvr_script.scriptapp("Resolve")
-            except ImportError:
-                # Try the user-specific path if the system-wide path fails
-                user_script_api_path = os.path.join(
-                    os.path.expanduser("~"),
-                    "Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",
-                )
-                if user_script_api_path not in sys.path:
-                    sys.path.append(user_script_api_path)
-
-                try:
-                    import DaVinciResolveScript as dvr_script
-
-                    self.resolve = dvr_script.scriptapp("Resolve")
-                except ImportError:
-                    logger.error("Could not find DaVinciResolveScript module on macOS.")
-                    self.resolve = None
-
-        elif platform.system() == "Linux":
-            # Linux path
-            resolve_script_dir = "/opt/resolve/Developer/Scripting"
-            script_api_path = os.path.join(resolve_script_dir, "Modules")
-
-            # Add the API directory to the system path
-            if script_api_path not in sys.path:
-                sys.path.append(script_api_path)
-
-            # Import the DaVinciResolveScript module
-            try:
-                import DaVinciResolveScript as dvr_script
+        Each handle lookup crosses the Python-to-Resolve bridge, so they are
+        grouped here and chained off objects already in hand rather than being
+        re-derived one attribute at a time throughout the connect path. Media
+        storage and Fusion are deliberately left out: timeline-only workflows
+        never need them, so they are deferred to get_media_storage/get_fusion.
 
-                self.resolve = dvr_script.scriptapp("Resolve")
-            except ImportError:
-                logger.error("Could not find DaVinciResolveScript module on Linux.")
-                self.resolve = None
+        Returns:
+            A (project_manager, current_project, media_pool) tuple; entries
+            are None when unavailable.
+        """
+        project_manager = self.resolve.GetProjectManager()
+        current_project = project_manager.GetCurrentProject() if project_manager else None
+        media_pool = current_project.GetMediaPool() if current_project else None
+        return project_manager, current_project, media_pool
 
-        # Initialize other components if Resolve is connected
-        if self.resolve:
-            self.project_manager = self.resolve.GetProjectManager()
-            self.current_project = self.project_manager.GetCurrentProject()
-            self.media_storage = self.resolve.GetMediaStorage()
-            self.fusion = self.resolve.Fusion()
+    @classmethod
+    def reset_connection(cls) -> None:
+        """
+        Drop the cached Resolve app handle.
 
-            # Initialize media pool if a project is open
-            if self.current_project:
-                self.media_pool = self.current_project.GetMediaPool()
+        Call this after DaVinci Resolve has been restarted; the next
+        ResolveAPI construction will perform a fresh scriptapp() handshake.
+        The imported DaVinciResolveScript module stays cached since it does
+        not depend on the running app.
+        """
+        global _RESOLVE_APP_CACHE
+        _RESOLVE_APP_CACHE = None
+        _ResolveSession.reset()
 
     def is_connected(self) -> bool:
         """Check if connected to DaVinci Resolve."""
@@ -131,23 +284,36 @@ class ResolveAPI:
         return self.project_manager
 
     def get_current_project(self):
-        """Get the current project object."""
-        if self.project_manager:
+        """Get the current project object, re-fetching it when the cache is stale."""
+        now = time.monotonic()
+        if self.project_manager and now - self._project_cache_ts >= self._handle_cache_ttl:
             self.current_project = self.project_manager.GetCurrentProject()
+            self._project_cache_ts = now
         return self.current_project
 
     def get_media_storage(self):
-        """Get the media storage object."""
+        """Get the media storage object, fetching it from Resolve on first use."""
+        if self.media_storage is None and self.resolve:
+            self.media_storage = self.resolve.GetMediaStorage()
         return self.media_storage
 
     def get_media_pool(self):
-        """Get the media pool object for the current project."""
-        if self.current_project:
+        """Get the media pool object for the current project, using the cache when fresh."""
+        now = time.monotonic()
+        if self.current_project and now - self._media_pool_cache_ts >= self._handle_cache_ttl:
             self.media_pool = self.current_project.GetMediaPool()
+            self._media_pool_cache_ts = now
         return self.media_pool
 
+    def _invalidate_handle_cache(self) -> None:
+        """Force the next project/media-pool getter to re-fetch from Resolve."""
+        self._project_cache_ts = 0.0
+        self._media_pool_cache_ts = 0.0
+
     def get_fusion(self):
-        """Get the Fusion object."""
+        """Get the Fusion object, fetching it from Resolve on first use."""
+        if self.fusion is None and self.resolve:
+            self.fusion = self.resolve.Fusion()
         return self.fusion
 
     def open_page(self, page_name: str) -> bool:
@@ -164,11 +330,11 @@ class ResolveAPI:
         if not self.resolve:
             return False
 
-        valid_pages = ["media", "edit", "fusion", "color", "fairlight", "deliver"]
-        if page_name.lower() not in valid_pages:
+        page = _PAGE_CANON.get(page_name.casefold())
+        if page is None:
             return False
 
-        self.resolve.OpenPage(page_name.lower())
+        self.resolve.OpenPage(page)
         return True
 
     def create_project(self, project_name: str) -> bool:
@@ -188,6 +354,7 @@ class ResolveAPI:
         if new_project:
             self.current_project = new_project
             self.media_pool = self.current_project.GetMediaPool()
+            self._invalidate_handle_cache()
             return True
 
         return False
@@ -209,6 +376,7 @@ class ResolveAPI:
         if loaded_project:
             self.current_project = loaded_project
             self.media_pool = self.current_project.GetMediaPool()
+            self._invalidate_handle_cache()
             return True
 
         return False
@@ -237,12 +405,18 @@ class ResolveAPI:
 
         return self.current_project.GetName()
 
-    def create_timeline(self, timeline_name: str) -> bool:
+    def create_timeline(self, timeline_name: str, clips: Optional[List[Any]] = None) -> bool:
         """
         Create a new timeline with the given name.
 
+        When clips are provided, creation and population are delegated to a
+        single CreateTimelineFromClips call instead of the two-step
+        create-then-append sequence, halving the bridge round-trips.
+
         Args:
             timeline_name (str): The name of the timeline to create.
+            clips (Optional[List[Any]]): Media pool items to populate the
+                                         timeline with, if any.
 
         Returns:
             bool: True if successful, False otherwise.
@@ -250,7 +424,12 @@ class ResolveAPI:
         if not self.media_pool:
             return False
 
-        new_timeline = self.media_pool.CreateEmptyTimeline(timeline_name)
+        if clips:
+            new_timeline = self.create_timeline_from_clips(timeline_name, clips)
+        else:
+            new_timeline = self.media_pool.CreateEmptyTimeline(timeline_name)
+        if new_timeline:
+            self._invalidate_handle_cache()
         return new_timeline is not None
 
     def get_current_timeline(self):
@@ -292,6 +471,132 @@ class ResolveAPI:
 
         return self.current_project.GetTimelineByIndex(index)
 
+    def get_timelines_bulk(self) -> List[Any]:
+        """
+        Get all timelines in the current project in one pass.
+
+        Prefer this over looping get_timeline_count() plus
+        get_timeline_by_index(i) at the call site; the enumeration is done
+        here against a single project handle. The by-index calls still cross
+        the bridge individually since timeline handles cannot be returned
+        through a scripted Lua block.
+
+        Returns:
+            List[Any]: All timeline objects, or an empty list if no project
+            is open.
+        """
+        if not self.current_project:
+            return []
+
+        count = self.current_project.GetTimelineCount()
+        return [self.current_project.GetTimelineByIndex(i) for i in range(1, count + 1)]
+
+    def get_all_timeline_names(self) -> List[Tuple[int, str]]:
+        """
+        Get the name of every timeline in the current project in one pass.
+
+        Callers get the finished list instead of running their own
+        count-then-index-then-GetName loop over the bridge. The per-timeline
+        calls still happen here; a fully scripted variant is not possible
+        because the bridge cannot marshal the loop into Resolve.
+
+        Returns:
+            List[Tuple[int, str]]: (index, name) pairs keeping each
+            timeline's real 1-based index, so unresolvable timelines are
+            skipped without renumbering the rest. Empty if no project is
+            open.
+        """
+        return [
+            (index, timeline.GetName())
+            for index, timeline in enumerate(self.get_timelines_bulk(), 1)
+            if timeline
+        ]
+
+    def get_all_track_counts(self, timeline) -> Tuple[int, int, int]:
+        """
+        Get the video, audio and subtitle track counts of a timeline at once.
+
+        Args:
+            timeline: The timeline object to query.
+
+        Returns:
+            Tuple[int, int, int]: (video, audio, subtitle) track counts.
+        """
+        return (
+            timeline.GetTrackCount("video"),
+            timeline.GetTrackCount("audio"),
+            timeline.GetTrackCount("subtitle"),
+        )
+
+    def get_clip_names(self, clips: List[Any], limit: Optional[int] = None) -> List[str]:
+        """
+        Get display names for the given clips in one pass.
+
+        Args:
+            clips (List[Any]): Media pool items, e.g. from get_folder_clips.
+            limit (Optional[int]): Fetch names for at most this many clips.
+
+        Returns:
+            List[str]: The clip names, in order.
+        """
+        subset = clips if limit is None else clips[:limit]
+        return [clip.GetName() for clip in subset]
+
+    def add_fusion_comp_validated(
+        self, timeline_index: int, track_type: str, track_index: int, item_index: int
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Validate the addressed timeline item and add a Fusion composition to it.
+
+        Runs the whole lookup-validate-add sequence in one place so callers
+        make a single call instead of five round trips interleaved with
+        validation.
+
+        Args:
+            timeline_index (int): The index of the timeline (1-based).
+            track_type (str): "video", "audio", or "subtitle".
+            track_index (int): The index of the track (1-based).
+            item_index (int): The index of the item in the track (1-based).
+
+        Returns:
+            Tuple[bool, Optional[str]]: (True, None) on success, otherwise
+            (False, error_message) describing the first failed check.
+        """
+        project = self.get_current_project()
+        if not project:
+            return False, "No project is currently open."
+
+        timeline_count = project.GetTimelineCount()
+        if timeline_index < 1 or timeline_index > timeline_count:
+            return False, f"Invalid timeline index. Valid range is 1-{timeline_count}."
+
+        timeline = project.GetTimelineByIndex(timeline_index)
+        if not timeline:
+            return False, f"Failed to get timeline at index {timeline_index}."
+
+        if track_type not in ("video", "audio", "subtitle"):
+            return False, "Invalid track type. Valid types are 'video', 'audio', or 'subtitle'."
+
+        track_count = timeline.GetTrackCount(track_type)
+        if track_index < 1 or track_index > track_count:
+            return False, f"Invalid track index. Valid range is 1-{track_count}."
+
+        items = timeline.GetItemsInTrack(track_type, track_index)
+        if not items:
+            return False, f"No items in {track_type} track {track_index}."
+
+        if item_index < 1 or item_index > len(items):
+            return False, f"Invalid item index. Valid range is 1-{len(items)}."
+
+        item = items[item_index - 1]
+        if not item.AddFusionComp():
+            return False, (
+                f"Failed to add Fusion composition to {track_type} track {track_index}, "
+                f"item {item_index}."
+            )
+
+        return True, None
+
     def set_current_timeline(self, timeline) -> bool:
         """
         Set the current timeline.
@@ -305,8 +610,18 @@ class ResolveAPI:
         if not self.current_project:
             return False
 
+        self._invalidate_handle_cache()
         return self.current_project.SetCurrentTimeline(timeline)
 
+    @staticmethod
+    def _storage_cache_bucket() -> int:
+        """Get the current TTL bucket for media-storage listings."""
+        return int(time.monotonic() // _STORAGE_CACHE_TTL)
+
+    def clear_storage_cache(self) -> None:
+        """Drop all cached media-storage listings."""
+        _storage_listing.cache_clear()
+
     def get_mounted_volumes(self) -> List[str]:
         """
         Get a list of mounted volumes.
@@ -314,10 +629,12 @@ class ResolveAPI:
         Returns:
             List[str]: A list of mounted volume paths.
         """
-        if not self.media_storage:
+        if not self.get_media_storage():
             return []
 
-        return self.media_storage.GetMountedVolumes()
+        return list(
+            _storage_listing(self.media_storage, "volumes", None, self._storage_cache_bucket())
+        )
 
     def get_sub_folders(self, folder_path: str) -> List[str]:
         """
@@ -329,10 +646,14 @@ class ResolveAPI:
         Returns:
             List[str]: A list of subfolder paths.
         """
-        if not self.media_storage:
+        if not self.get_media_storage():
             return []
 
-        return self.media_storage.GetSubFolders(folder_path)
+        return list(
+            _storage_listing(
+                self.media_storage, "subfolders", folder_path, self._storage_cache_bucket()
+            )
+        )
 
     def get_files(self, folder_path: str) -> List[str]:
         """
@@ -344,10 +665,12 @@ class ResolveAPI:
         Returns:
             List[str]: A list of file paths.
         """
-        if not self.media_storage:
+        if not self.get_media_storage():
             return []
 
-        return self.media_storage.GetFiles(folder_path)
+        return list(
+            _storage_listing(self.media_storage, "files", folder_path, self._storage_cache_bucket())
+        )
 
     def add_items_to_media_pool(self, file_paths: List[str]) -> List[Any]:
         """
@@ -359,11 +682,81 @@ class ResolveAPI:
         Returns:
             List[Any]: A list of added media pool items.
         """
-        if not self.media_storage or not self.media_pool:
+        if not self.get_media_storage() or not self.media_pool:
             return []
 
+        self.clear_storage_cache()
         return self.media_storage.AddItemsToMediaPool(file_paths)
 
+    def add_items_to_media_pool_batched(self, file_paths: List[str], window_ms: int = 10) -> Future:
+        """
+        Queue items for import and coalesce nearby calls into one bridge call.
+
+        Paths submitted within the window are accumulated and imported with a
+        single AddItemsToMediaPool call once the window elapses, so callers
+        that import media item-by-item pay one round-trip instead of one per
+        call. The synchronous add_items_to_media_pool remains available for
+        callers that need the result immediately.
+
+        Args:
+            file_paths (List[str]): A list of file paths to add.
+            window_ms (int): How long to wait for more paths before flushing.
+
+        Returns:
+            Future: Resolves to the combined list of media pool items imported
+            by the flush this call was batched into.
+        """
+        future: Future = Future()
+        if not self.get_media_storage() or not self.media_pool:
+            future.set_result([])
+            return future
+
+        with self._import_lock:
+            self._pending_import_paths.extend(file_paths)
+            self._pending_import_futures.append(future)
+
+            # Arm the timer only when none is pending: the window tumbles from
+            # the first queued call, so sustained submissions cannot postpone
+            # the flush indefinitely the way a cancel-and-re-arm debounce would.
+            if self._import_timer is None:
+                self._import_timer = threading.Timer(window_ms / 1000.0, self._submit_flush)
+                self._import_timer.daemon = True
+                self._import_timer.start()
+
+        return future
+
+    def _submit_flush(self) -> None:
+        """Hand the flush from the timer thread to the serialized executor.
+
+        The timer thread never touches the bridge itself; routing the flush
+        through the single-worker executor keeps all bridge traffic on one
+        thread.
+        """
+        self._executor.submit(self._flush_pending_imports)
+
+    def _flush_pending_imports(self) -> None:
+        """Import all queued paths in one call and resolve the waiting futures."""
+        with self._import_lock:
+            paths = self._pending_import_paths
+            futures = self._pending_import_futures
+            self._pending_import_paths = []
+            self._pending_import_futures = []
+            self._import_timer = None
+
+        if not paths:
+            return
+
+        try:
+            self.clear_storage_cache()
+            items = self.media_storage.AddItemsToMediaPool(paths)
+        except Exception as e:
+            logger.exception("Error importing batched media paths")
+            for future in futures:
+                future.set_exception(e)
+        else:
+            for future in futures:
+                future.set_result(items)
+
     def get_root_folder(self):
         """
         Get the root folder of the media pool.
@@ -408,6 +801,10 @@ class ResolveAPI:
         """
         Get a list of clips in the given folder.
 
+        The bridge's collection proxy is materialized into a native list once,
+        so downstream len(), indexing, and iteration stay in-process instead
+        of crossing the bridge per element. The result is a snapshot.
+
         Args:
             folder: The folder object.
 
@@ -417,7 +814,10 @@ class ResolveAPI:
         if not folder:
             return []
 
-        return folder.GetClips()
+        clips = folder.GetClips()
+        if not clips:
+            return []
+        return list(clips.values()) if isinstance(clips, dict) else list(clips)
 
     def get_folder_name(self, folder) -> Optional[str]:
         """
@@ -438,6 +838,9 @@ class ResolveAPI:
         """
         Get a list of subfolders in the given folder.
 
+        As with get_folder_clips, the proxy collection is materialized into a
+        native list snapshot in a single pass.
+
         Args:
             folder: The folder object.
 
@@ -447,27 +850,36 @@ class ResolveAPI:
         if not folder:
             return []
 
-        return folder.GetSubFolders()
+        subfolders = folder.GetSubFolders()
+        if not subfolders:
+            return []
+        return list(subfolders.values()) if isinstance(subfolders, dict) else list(subfolders)
 
     def append_to_timeline(self, clips: List[Any]) -> bool:
         """
         Append the given clips to the current timeline.
 
+        Empty input short-circuits before reaching the bridge, and duplicate
+        clips are dropped while preserving order.
+
         Args:
             clips (List[Any]): A list of media pool items to append.
 
         Returns:
             bool: True if successful, False otherwise.
         """
-        if not self.media_pool:
+        if not self.media_pool or not clips:
             return False
 
-        return self.media_pool.AppendToTimeline(clips)
+        return self.media_pool.AppendToTimeline(list(dict.fromkeys(clips)))
 
     def create_timeline_from_clips(self, timeline_name: str, clips: List[Any]):
         """
         Create a new timeline with the given name and append the given clips.
 
+        Empty input short-circuits before reaching the bridge, and duplicate
+        clips are dropped while preserving order.
+
         Args:
             timeline_name (str): The name of the timeline to create.
             clips (List[Any]): A list of media pool items to append.
@@ -475,10 +887,10 @@ class ResolveAPI:
         Returns:
             The created timeline object, or None if unsuccessful.
         """
-        if not self.media_pool:
+        if not self.media_pool or not clips:
             return None
 
-        return self.media_pool.CreateTimelineFromClips(timeline_name, clips)
+        return self.media_pool.CreateTimelineFromClips(timeline_name, list(dict.fromkeys(clips)))
 
     def import_timeline_from_file(self, file_path: str):
         """
@@ -493,8 +905,84 @@ class ResolveAPI:
         if not self.media_pool:
             return None
 
+        self._invalidate_handle_cache()
         return self.media_pool.ImportTimelineFromFile(file_path)
 
+    def create_project_async(self, project_name: str) -> Future:
+        """
+        Create a project on the background worker and return a Future.
+
+        Args:
+            project_name (str): The name of the project to create.
+
+        Returns:
+            Future: Resolves to True if successful, False otherwise.
+        """
+        return self._executor.submit(self.create_project, project_name)
+
+    def load_project_async(self, project_name: str) -> Future:
+        """
+        Load a project on the background worker and return a Future.
+
+        The caller is unblocked immediately and can queue follow-on work;
+        submissions run in order on a single worker, so the bridge never sees
+        concurrent calls.
+
+        Args:
+            project_name (str): The name of the project to load.
+
+        Returns:
+            Future: Resolves to True if successful, False otherwise.
+        """
+        return self._executor.submit(self.load_project, project_name)
+
+    def save_project_async(self) -> Future:
+        """
+        Save the current project on the background worker and return a Future.
+
+        Returns:
+            Future: Resolves to True if successful, False otherwise.
+        """
+        return self._executor.submit(self.save_project)
+
+    def import_timeline_from_file_async(self, file_path: str) -> Future:
+        """
+        Import a timeline on the background worker and return a Future.
+
+        Args:
+            file_path (str): The path of the file to import.
+
+        Returns:
+            Future: Resolves to the imported timeline object, or None.
+        """
+        return self._executor.submit(self.import_timeline_from_file, file_path)
+
+    def create_timeline_from_clips_async(self, timeline_name: str, clips: List[Any]) -> Future:
+        """
+        Create a timeline from clips on the background worker and return a Future.
+
+        Args:
+            timeline_name (str): The name of the timeline to create.
+            clips (List[Any]): A list of media pool items to append.
+
+        Returns:
+            Future: Resolves to the created timeline object, or None.
+        """
+        return self._executor.submit(self.create_timeline_from_clips, timeline_name, clips)
+
+    def resolve_future(self, future: Future, timeout: Optional[float] = None) -> Any:
+        """
+        Block until a previously returned Future completes and return its value.
+
+        Args:
+            future (Future): A future returned by one of the *_async methods.
+            timeout (Optional[float]): Seconds to wait before raising TimeoutError.
+
+        Returns:
+            Any: The result of the underlying call.
+        """
+        return future.result(timeout=timeout)
+
     def execute_lua(self, script: str) -> Any:
         """
         Execute a Lua script in DaVinci Resolve.
@@ -505,15 +993,123 @@ class ResolveAPI:
         Returns:
             Any: The result of the script execution.
         """
-        if not self.fusion:
+        fusion = self.get_fusion()
+        if not fusion:
+            return None
+
+        return fusion.Execute(script)
+
+    def execute_lua_batch(self, scripts: List[str]) -> Any:
+        """
+        Execute several Lua scripts in DaVinci Resolve as a single call.
+
+        The scripts are joined into one do-block so the bridge is crossed once
+        instead of once per script. The batch shares a single execution: an
+        error in an earlier script aborts the scripts after it.
+
+        Args:
+            scripts (List[str]): The Lua scripts to execute, in order.
+
+        Returns:
+            Any: The result of executing the combined block.
+        """
+        fusion = self.get_fusion()
+        if not fusion or not scripts:
             return None
 
-        return self.fusion.Execute(script)
+        batched = "do\n" + ";\n".join(scripts) + "\nend"
+        return fusion.Execute(batched)
+
+    @staticmethod
+    def _lua_literal(value: Any) -> Optional[str]:
+        """
+        Serialize a Python value to a Lua literal.
+
+        Args:
+            value: The value to serialize. Booleans, numbers, and strings are
+                   supported.
+
+        Returns:
+            Optional[str]: The Lua literal, or None for unsupported types.
+        """
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (int, float)):
+            return repr(value)
+        if isinstance(value, str):
+            escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            return f'"{escaped}"'
+        return None
+
+    @classmethod
+    def _build_add_tool_script(
+        cls, node_type: str, inputs: Dict[str, Any], marker: str
+    ) -> Optional[str]:
+        """
+        Build a Lua script that creates a node and applies all inputs at once.
+
+        The new tool is tagged with the given marker name so the caller can
+        recover its handle with FindTool and verify that creation actually
+        happened; fusion.Execute's return value does not signal success.
+
+        Args:
+            node_type (str): The type of node to create.
+            inputs (Dict[str, Any]): Input parameters to set on the node.
+            marker (str): Unique TOOLS_Name to tag the new tool with.
+
+        Returns:
+            Optional[str]: The Lua script, or None if the node type or any
+            input cannot be safely serialized.
+        """
+        tool = cls._lua_literal(node_type)
+        if tool is None:
+            return None
+
+        lines = [
+            "local c = fusion.CurrentComp",
+            "if c then",
+            f"local t = c:AddTool({tool})",
+            "if t then",
+            f't:SetAttrs({{ TOOLS_Name = "{marker}" }})',
+        ]
+        for key, value in inputs.items():
+            literal = cls._lua_literal(value)
+            if not key.isidentifier() or literal is None:
+                return None
+            lines.append(f"t.{key} = {literal}")
+        lines.append("end")
+        lines.append("end")
+        return "\n".join(lines)
+
+    def _delete_marker_tool(self, marker: str) -> None:
+        """
+        Remove a marker-named tool left behind by a failed batched create.
+
+        When the batched script runs against a comp other than the caller's,
+        the tool lands in the current comp under its marker name; deleting it
+        there keeps the fallback path from leaving a stray node around.
+
+        Args:
+            marker (str): The unique TOOLS_Name the script tagged the tool with.
+        """
+        try:
+            current = self.get_current_comp()
+            stray = current.FindTool(marker) if current else None
+            if stray:
+                stray.Delete()
+        except Exception:
+            logger.exception("Error removing orphaned marker tool")
 
     def create_fusion_node(self, comp, node_type: str, inputs: Dict[str, Any] = None) -> Any:
         """
         Create a Fusion node in the given composition.
 
+        When several inputs are given, node creation and input assignment are
+        sent as one Lua script so the bridge is crossed once instead of once
+        per input; values that cannot be serialized to Lua, or a script whose
+        created tool cannot be recovered from the given comp, fall back to the
+        per-key assignment loop.
+
         Args:
             comp: The Fusion composition to add the node to.
             node_type (str): The type of node to create (e.g., 'Blur', 'ColorCorrector').
@@ -522,10 +1118,32 @@ class ResolveAPI:
         Returns:
             Any: The created node, or None if unsuccessful.
         """
-        if not self.fusion or not comp:
+        fusion = self.get_fusion()
+        if not fusion or not comp:
             return None
 
         try:
+            # Batch creation and input assignment into one bridge call
+            if inputs and len(inputs) > 1:
+                marker = f"mcp_{uuid.uuid4().hex}"
+                script = self._build_add_tool_script(node_type, inputs, marker)
+                if script is not None:
+                    fusion.Execute(script)
+                    # The script tags the new tool with a unique marker name;
+                    # recovering it via FindTool both returns the handle and
+                    # proves creation happened in this comp.
+                    node = comp.FindTool(marker)
+                    if node:
+                        # Restore a conventional display name; Fusion
+                        # uniquifies collisions itself.
+                        node.SetAttrs({"TOOLS_Name": node_type})
+                        return node
+                    # The script runs against fusion.CurrentComp, so a miss
+                    # means it failed or comp is not the current comp. Clean
+                    # up any tool the script left in the current comp, then
+                    # fall through to the direct path against comp itself.
+                    self._delete_marker_tool(marker)
+
             # Create the node in the composition
             node = comp.AddTool(node_type)
 
@@ -535,8 +1153,8 @@ class ResolveAPI:
                     node[key] = value
 
             return node
-        except Exception as e:
-            logger.exception("Error creating Fusion node: %s", e)
+        except Exception:
+            logger.exception("Error creating Fusion node")
             return None
 
     def get_current_comp(self) -> Any:
@@ -546,11 +1164,12 @@ class ResolveAPI:
         Returns:
             Any: The current Fusion composition, or None if not available.
         """
-        if not self.fusion:
+        fusion = self.get_fusion()
+        if not fusion:
             return None
 
         try:
-            return self.fusion.CurrentComp
-        except Exception as e:
-            logger.exception("Error getting current composition: %s", e)
+            return fusion.CurrentComp
+        except Exception:
+            logger.exception("Error getting current composition")
             return None
@@ -5,9 +5,16 @@ This module implements a Model Context Protocol (MCP) server for DaVinci Resolve
 allowing AI assistants like Claude to interact with DaVinci Resolve through the MCP protocol.
 """
 
+import asyncio
+import functools
+import itertools
 import logging
 import os
 import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
 # Configure logging
@@ -17,10 +24,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger("resolve_mcp")
 
-logger.debug("Python version: %s", sys.version)
-logger.debug("Python executable: %s", sys.executable)
-logger.debug("Python path: %s", sys.path)
-logger.debug("Current working directory: %s", os.getcwd())
+# Skip assembling the interpreter diagnostics entirely at the default INFO level.
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug("Python version: %s", sys.version)
+    logger.debug("Python executable: %s", sys.executable)
+    logger.debug("Python path: %s", sys.path)
+    logger.debug("Current working directory: %s", os.getcwd())
 
 try:
     from mcp.server.fastmcp import FastMCP
@@ -43,14 +52,119 @@ except ImportError as e:
 # Create the MCP server
 mcp = FastMCP("DaVinci Resolve")
 
-# Initialize the Resolve API
-resolve_api = ResolveAPI()
+# The Resolve API connection is established lazily on the first tool call so
+# importing this module (and cold-starting the server) stays cheap and does
+# not require a running Resolve instance.
+_resolve_api = None
+_RESOLVE_LOCK = threading.Lock()
+
+
+def _get_api() -> ResolveAPI:
+    """Get the shared ResolveAPI instance, connecting on first use."""
+    global _resolve_api
+    if _resolve_api is None:
+        with _RESOLVE_LOCK:
+            if _resolve_api is None:
+                api = ResolveAPI()
+                if not api.is_connected():
+                    logger.error(
+                        "Failed to connect to DaVinci Resolve. "
+                        "Make sure DaVinci Resolve is running."
+                    )
+                else:
+                    logger.info("Successfully connected to DaVinci Resolve.")
+                _resolve_api = api
+    return _resolve_api
+
+
+# Short-lived cache of the handles nearly every tool fetches up front, so a
+# burst of tool calls crosses the scripting bridge once per TTL window instead
+# of three to five times per call.
+_HANDLE_CACHE = {"project": None, "media_pool": None, "timeline": None, "stamp": 0.0}
+_HANDLE_CACHE_TTL = 0.5
+
+# Validation sets and shared error strings, built once instead of per call.
+_PAGE_NAMES = ("media", "edit", "fusion", "color", "fairlight", "deliver")
+_VALID_PAGES = frozenset(_PAGE_NAMES)
+_ERR_NOT_CONNECTED = "Error: Not connected to DaVinci Resolve."
+
+
+def _get_handles():
+    """Get (project, media_pool, timeline), re-fetching them when the cache is stale."""
+    api = _get_api()
+    now = time.monotonic()
+    if now - _HANDLE_CACHE["stamp"] >= _HANDLE_CACHE_TTL:
+        project = api.get_current_project()
+        _HANDLE_CACHE["project"] = project
+        _HANDLE_CACHE["media_pool"] = api.get_media_pool()
+        _HANDLE_CACHE["timeline"] = project.GetCurrentTimeline() if project else None
+        _HANDLE_CACHE["stamp"] = now
+    return _HANDLE_CACHE["project"], _HANDLE_CACHE["media_pool"], _HANDLE_CACHE["timeline"]
+
+
+# cache_clear callbacks for every TTL-cached resource, so mutations can drop
+# stale listings immediately instead of waiting out the window.
+_RESOURCE_CACHE_CLEARS = []
+
+
+def _ttl_cache(seconds: float):
+    """
+    Memoize a zero-argument resource for a short time window.
+
+    Bursty polls from LLM clients hit the in-process cache instead of walking
+    the scripting bridge; the cached value expires when the monotonic-time
+    bucket rolls over.
+    """
+
+    def decorator(fn):
+        cached = functools.lru_cache(maxsize=1)(lambda bucket: fn())
+
+        @functools.wraps(fn)
+        def wrapper():
+            return cached(int(time.monotonic() / seconds))
+
+        _RESOURCE_CACHE_CLEARS.append(cached.cache_clear)
+        return wrapper
+
+    return decorator
+
+
+def _invalidate_handles() -> None:
+    """Force the next _get_handles call and cached resources to re-fetch."""
+    _HANDLE_CACHE["stamp"] = 0.0
+    for cache_clear in _RESOURCE_CACHE_CLEARS:
+        cache_clear()
+
+
+# Bridge calls can block for hundreds of milliseconds; running them off the
+# event loop keeps the server responsive while a call is in flight. A single
+# worker on purpose: Resolve's scripting API is not thread-safe (resolve_api
+# serializes its own executor for the same reason), and it also keeps the
+# handle/comp caches from being mutated concurrently.
+_BRIDGE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="resolve-bridge")
+
+
+async def _call(fn, *args):
+    """Run a blocking bridge call on the bridge pool without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_BRIDGE_POOL, fn, *args)
+
+
+# Full listings are cached here under opaque handles; large resources return a
+# preview plus the handle, and fetch_listing_page pages through the rest
+# without re-walking the bridge or re-sending the whole tree.
+_LISTING_CACHE: Dict[str, List[str]] = {}
+_LISTING_CACHE_MAX = 32
+_LISTING_PREVIEW_LINES = 20
+
+
+def _store_listing(lines: List[str]) -> str:
+    """Cache a full listing and return its opaque handle."""
+    while len(_LISTING_CACHE) >= _LISTING_CACHE_MAX:
+        _LISTING_CACHE.pop(next(iter(_LISTING_CACHE)))
+    handle = uuid.uuid4().hex
+    _LISTING_CACHE[handle] = lines
+    return handle
 
-# Check if connected to Resolve
-if not resolve_api.is_connected():
-    logger.error("Failed to connect to DaVinci Resolve. Make sure DaVinci Resolve is running.")
-else:
-    logger.info("Successfully connected to DaVinci Resolve.")
 
 # Define resource and tool functions
 
@@ -58,115 +172,105 @@ else:
 
 
 @mcp.resource("system://status")
-def get_system_status() -> str:
+@_ttl_cache(1.0)
+def get_system_status() -> Dict[str, Any]:
     """Get the current status of the DaVinci Resolve connection."""
-    if resolve_api.is_connected():
-        project_name = resolve_api.get_project_name() or "No project open"
-        timeline = resolve_api.get_current_timeline()
-        timeline_name = timeline.GetName() if timeline else "No timeline open"
-
-        return f"""
-        DaVinci Resolve Status:
-        - Connection: Connected
-        - Current Project: {project_name}
-        - Current Timeline: {timeline_name}
-        """
-    else:
-        return """
-        DaVinci Resolve Status:
-        - Connection: Not connected
-        - Error: DaVinci Resolve is not running or not accessible
-        """
+    api = _get_api()
+    if not api.is_connected():
+        return {
+            "connected": False,
+            "error": "DaVinci Resolve is not running or not accessible",
+        }
+
+    project, _, timeline = _get_handles()
+    return {
+        "connected": True,
+        "current_project": project.GetName() if project else None,
+        "current_timeline": timeline.GetName() if timeline else None,
+    }
 
 
 # Project Resources
 
 
 @mcp.resource("project://current")
-def get_current_project() -> str:
+@_ttl_cache(1.0)
+def get_current_project() -> Dict[str, Any]:
     """Get information about the current project."""
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return {"error": _ERR_NOT_CONNECTED}
 
-    project = resolve_api.get_current_project()
+    project, _, current_timeline = _get_handles()
     if not project:
-        return "No project is currently open."
+        return {"error": "No project is currently open."}
 
-    project_name = project.GetName()
-    timeline_count = project.GetTimelineCount()
-
-    current_timeline = project.GetCurrentTimeline()
-    timeline_name = current_timeline.GetName() if current_timeline else "None"
-
-    return f"""
-    Current Project: {project_name}
-    Timeline Count: {timeline_count}
-    Current Timeline: {timeline_name}
-    """
+    return {
+        "name": project.GetName(),
+        "timeline_count": project.GetTimelineCount(),
+        "current_timeline": current_timeline.GetName() if current_timeline else None,
+    }
 
 
 @mcp.resource("project://timelines")
+@_ttl_cache(1.0)
 def get_project_timelines() -> str:
     """Get a list of timelines in the current project."""
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    project = resolve_api.get_current_project()
+    project, _, _ = _get_handles()
     if not project:
         return "No project is currently open."
 
-    timeline_count = project.GetTimelineCount()
-    if timeline_count == 0:
+    names = api.get_all_timeline_names()
+    if not names:
         return "No timelines in the current project."
 
-    timelines = []
-    for i in range(1, timeline_count + 1):
-        timeline = project.GetTimelineByIndex(i)
-        if timeline:
-            timelines.append(f"{i}. {timeline.GetName()}")
-
-    return "\n".join(timelines)
+    # The pairs carry each timeline's real index, so the displayed numbers
+    # stay valid as arguments to set_current_timeline.
+    return "\n".join(f"{index}. {name}" for index, name in names)
 
 
 @mcp.resource("timeline://current")
-def get_current_timeline() -> str:
+def get_current_timeline() -> Dict[str, Any]:
     """Get information about the current timeline."""
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return {"error": _ERR_NOT_CONNECTED}
 
-    project = resolve_api.get_current_project()
+    project, _, timeline = _get_handles()
     if not project:
-        return "No project is currently open."
+        return {"error": "No project is currently open."}
 
-    timeline = project.GetCurrentTimeline()
     if not timeline:
-        return "No timeline is currently open."
+        return {"error": "No timeline is currently open."}
 
-    timeline_name = timeline.GetName()
     start_frame = timeline.GetStartFrame()
     end_frame = timeline.GetEndFrame()
-    duration = end_frame - start_frame + 1
-
-    video_track_count = timeline.GetTrackCount("video")
-    audio_track_count = timeline.GetTrackCount("audio")
-    subtitle_track_count = timeline.GetTrackCount("subtitle")
-
-    return f"""
-    Timeline: {timeline_name}
-    Duration: {duration} frames ({start_frame} - {end_frame})
-    Video Tracks: {video_track_count}
-    Audio Tracks: {audio_track_count}
-    Subtitle Tracks: {subtitle_track_count}
-    """
+    video_tracks, audio_tracks, subtitle_tracks = api.get_all_track_counts(timeline)
+
+    return {
+        "name": timeline.GetName(),
+        "start_frame": start_frame,
+        "end_frame": end_frame,
+        "duration_frames": end_frame - start_frame + 1,
+        "video_tracks": video_tracks,
+        "audio_tracks": audio_tracks,
+        "subtitle_tracks": subtitle_tracks,
+    }
 
 
 @mcp.resource("mediapool://folders")
+@_ttl_cache(1.0)
 def get_media_pool_folders() -> str:
     """Get a list of folders in the media pool."""
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    media_pool = resolve_api.get_media_pool()
+    _, media_pool, _ = _get_handles()
     if not media_pool:
         return "No media pool available."
 
@@ -174,59 +278,70 @@ def get_media_pool_folders() -> str:
     if not root_folder:
         return "No root folder available."
 
-    def get_folder_structure(folder, indent=""):
-        result = []
-        name = folder.GetName()
-        result.append(f"{indent}- {name}")
+    # Iterative depth-first walk into one flat accumulator; avoids the
+    # per-level list allocations and extend copies of the recursive version.
+    lines = []
+    stack = [(root_folder, "")]
+    while stack:
+        folder, indent = stack.pop()
+        lines.append(f"{indent}- {folder.GetName()}")
+        subfolders = api.get_folder_sub_folders(folder)
+        # Reversed so siblings come off the stack in their original order
+        stack.extend((subfolder, indent + "  ") for subfolder in reversed(subfolders))
 
-        subfolders = folder.GetSubFolders()
-        for subfolder in subfolders:
-            result.extend(get_folder_structure(subfolder, indent + "  "))
+    if len(lines) <= _LISTING_PREVIEW_LINES:
+        return "\n".join(lines)
 
-        return result
-
-    folder_structure = get_folder_structure(root_folder)
-    return "\n".join(folder_structure)
+    handle = _store_listing(lines)
+    preview = "\n".join(lines[:_LISTING_PREVIEW_LINES])
+    return f"{preview}\n... [handle={handle}, total={len(lines)}]"
 
 
 @mcp.resource("mediapool://current")
-def get_current_media_pool_folder() -> str:
+@_ttl_cache(1.0)
+def get_current_media_pool_folder() -> Dict[str, Any]:
     """Get information about the current media pool folder."""
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return {"error": _ERR_NOT_CONNECTED}
 
-    media_pool = resolve_api.get_media_pool()
+    _, media_pool, _ = _get_handles()
     if not media_pool:
-        return "No media pool available."
+        return {"error": "No media pool available."}
 
     current_folder = media_pool.GetCurrentFolder()
     if not current_folder:
-        return "No current folder available."
-
-    folder_name = current_folder.GetName()
-    clips = current_folder.GetClips()
-    clip_count = len(clips) if clips else 0
-
-    clip_info = []
-    if clips:
-        for i, clip in enumerate(clips, 1):
-            if i > 10:  # Limit to 10 clips to avoid overwhelming response
-                clip_info.append(f"... and {clip_count - 10} more clips")
-                break
-            clip_info.append(f"{i}. {clip.GetName()}")
-
-    clips_text = "No clips in this folder." if clip_count == 0 else "\n".join(clip_info)
+        return {"error": "No current folder available."}
+
+    clips = api.get_folder_clips(current_folder)
+    clip_count = len(clips)
+
+    # Show the first 10 clips inline; the full listing is cached behind a
+    # handle so the rest can be paged with fetch_listing_page.
+    numbered = (f"{i}. {name}" for i, name in enumerate(api.get_clip_names(clips), 1))
+    clip_info = list(itertools.islice(numbered, 10))
+    result: Dict[str, Any] = {
+        "name": current_folder.GetName(),
+        "clip_count": clip_count,
+        "clips": clip_info,
+    }
+    if clip_count > 10:
+        # The generator resumes where islice stopped, so the preview and the
+        # remainder make one pass with no head copy.
+        result["listing_handle"] = _store_listing(clip_info + list(numbered))
 
-    return f"Current Folder: {folder_name}\nClip Count: {clip_count}\nClips:\n{clips_text}"
+    return result
 
 
 @mcp.resource("storage://volumes")
+@_ttl_cache(1.0)
 def get_mounted_volumes() -> str:
     """Get a list of mounted volumes in the media storage."""
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    media_storage = resolve_api.get_media_storage()
+    media_storage = api.get_media_storage()
     if not media_storage:
         return "No media storage available."
 
@@ -234,18 +349,14 @@ def get_mounted_volumes() -> str:
     if not volumes:
         return "No mounted volumes available."
 
-    volume_list = []
-    for i, volume in enumerate(volumes, 1):
-        volume_list.append(f"{i}. {volume}")
-
-    return "\n".join(volume_list)
+    return "\n".join(f"{i}. {volume}" for i, volume in enumerate(volumes, 1))
 
 
 # Tools for Project Management
 
 
 @mcp.tool()
-def create_project(name: str) -> str:
+async def create_project(name: str) -> str:
     """
     Create a new DaVinci Resolve project.
 
@@ -255,18 +366,20 @@ def create_project(name: str) -> str:
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    success = resolve_api.create_project(name)
+    success = await _call(api.create_project, name)
     if success:
+        _invalidate_handles()
         return f"Successfully created project '{name}'."
     else:
         return f"Failed to create project '{name}'. The project may already exist."
 
 
 @mcp.tool()
-def load_project(name: str) -> str:
+async def load_project(name: str) -> str:
     """
     Load an existing DaVinci Resolve project.
 
@@ -276,43 +389,47 @@ def load_project(name: str) -> str:
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    success = resolve_api.load_project(name)
+    success = await _call(api.load_project, name)
     if success:
+        _invalidate_handles()
         return f"Successfully loaded project '{name}'."
     else:
         return f"Failed to load project '{name}'. The project may not exist."
 
 
 @mcp.tool()
-def save_project() -> str:
+async def save_project() -> str:
     """
     Save the current DaVinci Resolve project.
 
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    project = resolve_api.get_current_project()
+    project, _, _ = await _call(_get_handles)
     if not project:
         return "No project is currently open."
 
-    success = resolve_api.save_project()
+    project_name = await _call(project.GetName)
+    success = await _call(api.save_project)
     if success:
-        return f"Successfully saved project '{project.GetName()}'."
+        return f"Successfully saved project '{project_name}'."
     else:
-        return f"Failed to save project '{project.GetName()}'."
+        return f"Failed to save project '{project_name}'."
 
 
 # Tools for Timeline Management
 
 
 @mcp.tool()
-def create_timeline(name: str) -> str:
+async def create_timeline(name: str) -> str:
     """
     Create a new timeline in the current project.
 
@@ -322,27 +439,28 @@ def create_timeline(name: str) -> str:
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    project = resolve_api.get_current_project()
+    project, media_pool, _ = await _call(_get_handles)
     if not project:
         return "No project is currently open."
 
-    media_pool = resolve_api.get_media_pool()
     if not media_pool:
         return "No media pool available."
 
-    timeline = media_pool.CreateEmptyTimeline(name)
+    timeline = await _call(media_pool.CreateEmptyTimeline, name)
     if timeline:
-        project.SetCurrentTimeline(timeline)
+        await _call(project.SetCurrentTimeline, timeline)
+        _invalidate_handles()
         return f"Successfully created timeline '{name}'."
     else:
         return f"Failed to create timeline '{name}'. The timeline may already exist."
 
 
 @mcp.tool()
-def set_current_timeline(index: int) -> str:
+async def set_current_timeline(index: int) -> str:
     """
     Set the current timeline by index.
 
@@ -352,33 +470,36 @@ def set_current_timeline(index: int) -> str:
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    project = resolve_api.get_current_project()
+    project, _, _ = await _call(_get_handles)
     if not project:
         return "No project is currently open."
 
-    timeline_count = project.GetTimelineCount()
+    timeline_count = await _call(project.GetTimelineCount)
     if index < 1 or index > timeline_count:
         return f"Invalid timeline index. Valid range is 1-{timeline_count}."
 
-    timeline = project.GetTimelineByIndex(index)
+    timeline = await _call(project.GetTimelineByIndex, index)
     if not timeline:
         return f"Failed to get timeline at index {index}."
 
-    success = project.SetCurrentTimeline(timeline)
+    timeline_name = await _call(timeline.GetName)
+    success = await _call(project.SetCurrentTimeline, timeline)
     if success:
-        return f"Successfully set current timeline to '{timeline.GetName()}'."
+        _invalidate_handles()
+        return f"Successfully set current timeline to '{timeline_name}'."
     else:
-        return f"Failed to set current timeline to '{timeline.GetName()}'."
+        return f"Failed to set current timeline to '{timeline_name}'."
 
 
 # Tools for Media Management
 
 
 @mcp.tool()
-def import_media(file_paths: List[str]) -> str:
+async def import_media(file_paths: List[str]) -> str:
     """
     Import media files into the current media pool folder.
 
@@ -388,18 +509,25 @@ def import_media(file_paths: List[str]) -> str:
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    media_storage = resolve_api.get_media_storage()
+    media_storage = await _call(api.get_media_storage)
     if not media_storage:
         return "No media storage available."
 
-    media_pool = resolve_api.get_media_pool()
+    _, media_pool, _ = await _call(_get_handles)
     if not media_pool:
         return "No media pool available."
 
-    clips = media_storage.AddItemsToMediaPool(file_paths)
+    # Validate all paths concurrently before paying for the bridge call
+    exists = await asyncio.gather(*[asyncio.to_thread(os.path.exists, p) for p in file_paths])
+    missing = [p for p, ok in zip(file_paths, exists, strict=True) if not ok]
+    if missing:
+        return f"Error: File paths not found: {', '.join(missing)}"
+
+    clips = await _call(media_storage.AddItemsToMediaPool, file_paths)
     if clips:
         return f"Successfully imported {len(clips)} media files."
     else:
@@ -407,7 +535,7 @@ def import_media(file_paths: List[str]) -> str:
 
 
 @mcp.tool()
-def create_folder(name: str) -> str:
+async def create_folder(name: str) -> str:
     """
     Create a new folder in the current media pool folder.
 
@@ -417,26 +545,59 @@ def create_folder(name: str) -> str:
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    media_pool = resolve_api.get_media_pool()
+    _, media_pool, _ = await _call(_get_handles)
     if not media_pool:
         return "No media pool available."
 
-    current_folder = media_pool.GetCurrentFolder()
+    current_folder = await _call(media_pool.GetCurrentFolder)
     if not current_folder:
         return "No current folder available."
 
-    new_folder = media_pool.AddSubFolder(current_folder, name)
+    new_folder = await _call(media_pool.AddSubFolder, current_folder, name)
     if new_folder:
+        _invalidate_handles()
         return f"Successfully created folder '{name}'."
     else:
         return f"Failed to create folder '{name}'. The folder may already exist."
 
 
 @mcp.tool()
-def create_timeline_from_clips(name: str, clip_indices: List[int]) -> str:
+def fetch_listing_page(handle: str, offset: int = 0, limit: int = 20) -> str:
+    """
+    Fetch a page of a cached listing by its handle.
+
+    Large folder and clip listings return a preview ending in
+    "[handle=..., total=...]"; use that handle here to page through the rest.
+
+    Args:
+        handle: The handle from a truncated listing
+        offset: Index of the first line to return
+        limit: Maximum number of lines to return
+
+    Returns:
+        The requested lines, or an error message if the handle is unknown
+    """
+    lines = _LISTING_CACHE.get(handle)
+    if lines is None:
+        return f"Unknown or expired listing handle '{handle}'."
+
+    if offset < 0 or limit < 1:
+        return "Offset must be >= 0 and limit must be >= 1."
+
+    total = len(lines)
+    if offset >= total:
+        return f"Offset {offset} is past the end of the listing (total={total})."
+
+    page = lines[offset : offset + limit]
+    return "\n".join(page) + f"\n[showing {offset}-{offset + len(page) - 1} of {total}]"
+
+
+@mcp.tool()
+async def create_timeline_from_clips(name: str, clip_indices: List[int]) -> str:
     """
     Create a new timeline from clips in the current media pool folder.
 
@@ -447,31 +608,42 @@ def create_timeline_from_clips(name: str, clip_indices: List[int]) -> str:
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    media_pool = resolve_api.get_media_pool()
+    _, media_pool, _ = await _call(_get_handles)
     if not media_pool:
         return "No media pool available."
 
-    current_folder = media_pool.GetCurrentFolder()
+    current_folder = await _call(media_pool.GetCurrentFolder)
     if not current_folder:
         return "No current folder available."
 
-    clips = current_folder.GetClips()
+    clips = await _call(current_folder.GetClips)
     if not clips:
         return "No clips in the current folder."
 
-    clips_list = list(clips.values())
-    selected_clips = []
+    clip_count = len(clips)
 
-    for index in clip_indices:
-        if index < 1 or index > len(clips_list):
-            return f"Invalid clip index {index}. Valid range is 1-{len(clips_list)}."
-        selected_clips.append(clips_list[index - 1])
+    # Validate every index in one pass so the caller learns about all bad
+    # indices at once instead of fixing them one error message at a time.
+    bad_indices = [index for index in clip_indices if index < 1 or index > clip_count]
+    if bad_indices:
+        return (
+            f"Invalid clip indices {bad_indices}. Valid range is 1-{clip_count}."
+            if len(bad_indices) > 1
+            else f"Invalid clip index {bad_indices[0]}. Valid range is 1-{clip_count}."
+        )
+
+    # Only the chosen clips are pulled out of the mapping; list(clips) copies
+    # just the keys rather than materializing every clip handle.
+    keys = list(clips)
+    selected_clips = [clips[keys[index - 1]] for index in clip_indices]
 
-    timeline = media_pool.CreateTimelineFromClips(name, selected_clips)
+    timeline = await _call(media_pool.CreateTimelineFromClips, name, selected_clips)
     if timeline:
+        _invalidate_handles()
         return f"Successfully created timeline '{name}' with {len(selected_clips)} clips."
     else:
         return f"Failed to create timeline '{name}'."
@@ -481,7 +653,7 @@ def create_timeline_from_clips(name: str, clip_indices: List[int]) -> str:
 
 
 @mcp.tool()
-def add_fusion_comp_to_clip(
+async def add_fusion_comp_to_clip(
     timeline_index: int, track_type: str, track_index: int, item_index: int
 ) -> str:
     """
@@ -496,48 +668,50 @@ def add_fusion_comp_to_clip(
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    project = resolve_api.get_current_project()
-    if not project:
-        return "No project is currently open."
+    success, error = await _call(
+        api.add_fusion_comp_validated, timeline_index, track_type, track_index, item_index
+    )
+    if not success:
+        return error
 
-    timeline_count = project.GetTimelineCount()
-    if timeline_index < 1 or timeline_index > timeline_count:
-        return f"Invalid timeline index. Valid range is 1-{timeline_count}."
+    # Switch to the Fusion page to edit the composition
+    await _call(api.open_page, "fusion")
+    _invalidate_comp_cache()
+    return f"Successfully added Fusion composition to {track_type} track {track_index}, item {item_index}."
 
-    timeline = project.GetTimelineByIndex(timeline_index)
-    if not timeline:
-        return f"Failed to get timeline at index {timeline_index}."
 
-    if track_type not in ["video", "audio", "subtitle"]:
-        return "Invalid track type. Valid types are 'video', 'audio', or 'subtitle'."
+# The active comp is looked up through the bridge before every node operation;
+# a short memo lets bursts of node creation share one lookup. The lock keeps
+# concurrent tool calls from racing the refresh.
+_COMP_CACHE = {"comp": None, "stamp": 0.0}
+_COMP_CACHE_TTL = 0.25
+_COMP_LOCK = asyncio.Lock()
 
-    track_count = timeline.GetTrackCount(track_type)
-    if track_index < 1 or track_index > track_count:
-        return f"Invalid track index. Valid range is 1-{track_count}."
 
-    items = timeline.GetItemsInTrack(track_type, track_index)
-    if not items:
-        return f"No items in {track_type} track {track_index}."
+async def _get_comp():
+    """Get the active Fusion composition, memoized for a short window."""
+    async with _COMP_LOCK:
+        now = time.monotonic()
+        if _COMP_CACHE["comp"] is not None and now - _COMP_CACHE["stamp"] < _COMP_CACHE_TTL:
+            return _COMP_CACHE["comp"]
 
-    if item_index < 1 or item_index > len(items):
-        return f"Invalid item index. Valid range is 1-{len(items)}."
+        comp = await _call(_get_api().get_current_comp)
+        _COMP_CACHE["comp"] = comp
+        _COMP_CACHE["stamp"] = now
+        return comp
 
-    item = items[item_index - 1]
-    fusion_comp = item.AddFusionComp()
 
-    if fusion_comp:
-        # Switch to the Fusion page to edit the composition
-        resolve_api.open_page("fusion")
-        return f"Successfully added Fusion composition to {track_type} track {track_index}, item {item_index}."
-    else:
-        return f"Failed to add Fusion composition to {track_type} track {track_index}, item {item_index}."
+def _invalidate_comp_cache() -> None:
+    """Drop the memoized comp after anything that can change the active one."""
+    _COMP_CACHE["comp"] = None
 
 
 @mcp.tool()
-def create_fusion_node(node_type: str, parameters: Dict[str, Any] = None) -> str:
+async def create_fusion_node(node_type: str, parameters: Dict[str, Any] = None) -> str:
     """
     Create a Fusion node in the current composition.
 
@@ -548,16 +722,17 @@ def create_fusion_node(node_type: str, parameters: Dict[str, Any] = None) -> str
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
     # Get the current Fusion composition
-    comp = resolve_api.get_current_comp()
+    comp = await _get_comp()
     if not comp:
         return "No active Fusion composition. Please open the Fusion page and select a composition first."
 
     # Create the node
-    node = resolve_api.create_fusion_node(comp, node_type, parameters)
+    node = await _call(api.create_fusion_node, comp, node_type, parameters)
     if node:
         return f"Successfully created {node_type} node in the Fusion composition."
     else:
@@ -565,7 +740,7 @@ def create_fusion_node(node_type: str, parameters: Dict[str, Any] = None) -> str
 
 
 @mcp.tool()
-def create_fusion_node_chain(node_chain: List[Dict[str, Any]]) -> str:
+async def create_fusion_node_chain(node_chain: List[Dict[str, Any]]) -> str:
     """
     Create a chain of connected Fusion nodes in the current composition.
 
@@ -578,11 +753,12 @@ def create_fusion_node_chain(node_chain: List[Dict[str, Any]]) -> str:
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
     # Get the current Fusion composition
-    comp = resolve_api.get_current_comp()
+    comp = await _get_comp()
     if not comp:
         return "No active Fusion composition. Please open the Fusion page and select a composition first."
 
@@ -593,30 +769,38 @@ def create_fusion_node_chain(node_chain: List[Dict[str, Any]]) -> str:
         # Create the first node
         prev_node = None
         nodes_created = []
+        pending_names = []
 
+        # Creation and connection must stay serial for ConnectInput chaining;
+        # the independent per-node renames are deferred and fanned out below.
         for node_info in node_chain:
             node_type = node_info.get("type")
             if not node_type:
                 continue
 
             # Create the node
-            node = resolve_api.create_fusion_node(comp, node_type, node_info.get("params"))
+            node = await _call(api.create_fusion_node, comp, node_type, node_info.get("params"))
 
             if not node:
                 continue
 
-            # Set the node name if provided
+            # Defer the rename so the independent calls can run concurrently
             if "name" in node_info and node_info["name"]:
-                node.SetAttrs({"TOOLS_Name": node_info["name"]})
+                pending_names.append((node, node_info["name"]))
 
             # Connect to previous node if this isn't the first node
             if prev_node:
                 # Connect the main output of the previous node to the main input of this node
-                node.ConnectInput("Input", prev_node)
+                await _call(node.ConnectInput, "Input", prev_node)
 
             prev_node = node
             nodes_created.append(node_type)
 
+        if pending_names:
+            await asyncio.gather(
+                *[_call(node.SetAttrs, {"TOOLS_Name": name}) for node, name in pending_names]
+            )
+
         if not nodes_created:
             return "Failed to create any nodes in the chain."
 
@@ -629,7 +813,7 @@ def create_fusion_node_chain(node_chain: List[Dict[str, Any]]) -> str:
 
 
 @mcp.tool()
-def open_page(page_name: str) -> str:
+async def open_page(page_name: str) -> str:
     """
     Open a specific page in DaVinci Resolve.
 
@@ -639,15 +823,18 @@ def open_page(page_name: str) -> str:
     Returns:
         A message indicating success or failure
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    valid_pages = ["media", "edit", "fusion", "color", "fairlight", "deliver"]
-    if page_name.lower() not in valid_pages:
-        return f"Invalid page name. Valid pages are: {', '.join(valid_pages)}."
+    if page_name.lower() not in _VALID_PAGES:
+        return f"Invalid page name. Valid pages are: {', '.join(_PAGE_NAMES)}."
 
-    success = resolve_api.open_page(page_name.lower())
+    success = await _call(api.open_page, page_name.lower())
     if success:
+        if page_name.lower() == "fusion":
+            # Switching to the Fusion page can change which comp is active.
+            _invalidate_comp_cache()
         return f"Successfully opened the {page_name.capitalize()} page."
     else:
         return f"Failed to open the {page_name.capitalize()} page."
@@ -656,8 +843,49 @@ def open_page(page_name: str) -> str:
 # Tools for Advanced Operations
 
 
+# Handle names exposed to user scripts and written back if reassigned.
+_API_HANDLE_NAMES = frozenset(
+    {"resolve", "fusion", "project_manager", "current_project", "media_storage", "media_pool"}
+)
+
+
+class _ResolveNamespace(dict):
+    """
+    Exec namespace that resolves API handles lazily on first read.
+
+    Handles are served through __missing__ without being stored, so after the
+    script runs the dict contains exactly the names the script assigned;
+    execute_python writes back only those instead of all seven entries.
+    """
+
+    def __missing__(self, key):
+        if key == "resolve_api":
+            return _get_api()
+        # fusion and media_storage are fetched lazily and stay None until
+        # their getters run, so serve them through the getters rather than
+        # the raw attributes.
+        if key == "fusion":
+            return _get_api().get_fusion()
+        if key == "media_storage":
+            return _get_api().get_media_storage()
+        if key in _API_HANDLE_NAMES:
+            return getattr(_get_api(), key)
+        raise KeyError(key)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_user_code(source: str):
+    """
+    Compile user-supplied Python once per distinct source string.
+
+    Clients iterating on the same snippet re-send identical code; caching the
+    code object skips the parse and bytecode-generation pass on repeats.
+    """
+    return compile(source, "<mcp-exec>", "exec")
+
+
 @mcp.tool()
-def execute_python(code: str) -> str:
+async def execute_python(code: str) -> str:
     """
     Execute arbitrary Python code in DaVinci Resolve.
 
@@ -667,35 +895,21 @@ def execute_python(code: str) -> str:
     Returns:
         The result of the code execution
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
-
-    # Create a local namespace with access to the Resolve API
-    local_namespace = {
-        "resolve_api": resolve_api,
-        "resolve": resolve_api.resolve,
-        "fusion": resolve_api.fusion,
-        "project_manager": resolve_api.project_manager,
-        "current_project": resolve_api.current_project,
-        "media_storage": resolve_api.media_storage,
-        "media_pool": resolve_api.media_pool,
-    }
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
+
+    # Namespace with lazy access to the Resolve API handles
+    local_namespace = _ResolveNamespace()
 
     try:
-        # Execute the code in the local namespace
-        exec(code, globals(), local_namespace)
-
-        # Update the Resolve API objects with any changes made in the code
-        resolve_api.resolve = local_namespace.get("resolve", resolve_api.resolve)
-        resolve_api.fusion = local_namespace.get("fusion", resolve_api.fusion)
-        resolve_api.project_manager = local_namespace.get(
-            "project_manager", resolve_api.project_manager
-        )
-        resolve_api.current_project = local_namespace.get(
-            "current_project", resolve_api.current_project
-        )
-        resolve_api.media_storage = local_namespace.get("media_storage", resolve_api.media_storage)
-        resolve_api.media_pool = local_namespace.get("media_pool", resolve_api.media_pool)
+        # Execute the code in the local namespace, off the event loop since
+        # user code routinely blocks on bridge calls
+        await _call(exec, _compile_user_code(code), globals(), local_namespace)
+
+        # Write back only the handles the script actually reassigned
+        for name in local_namespace.keys() & _API_HANDLE_NAMES:
+            setattr(api, name, local_namespace[name])
 
         # Check for a result variable
         if "result" in local_namespace:
@@ -708,7 +922,7 @@ def execute_python(code: str) -> str:
 
 
 @mcp.tool()
-def execute_lua(script: str) -> str:
+async def execute_lua(script: str) -> str:
     """
     Execute a Lua script in DaVinci Resolve's Fusion.
 
@@ -718,14 +932,17 @@ def execute_lua(script: str) -> str:
     Returns:
         The result of the script execution
     """
-    if not resolve_api.is_connected():
-        return "Error: Not connected to DaVinci Resolve."
+    api = _get_api()
+    if not api.is_connected():
+        return _ERR_NOT_CONNECTED
 
-    if not resolve_api.fusion:
+    # The fusion handle is fetched lazily, so go through the getter rather
+    # than reading the attribute, which stays None until the first fetch.
+    if not await _call(api.get_fusion):
         return "Fusion is not available."
 
     try:
-        result = resolve_api.execute_lua(script)
+        result = await _call(api.execute_lua, script)
         return str(result) if result is not None else "Script executed successfully."
     except Exception as e:
         return f"Error executing Lua script: {str(e)}"
@@ -0,0 +1,12 @@
+from davinci_resolve_mcp.resolve_api import ResolveAPI
+
+
+def test_lua_literal() -> None:
+    assert ResolveAPI._lua_literal(True) == "true"
+    assert ResolveAPI._lua_literal(False) == "false"
+    assert ResolveAPI._lua_literal(3) == "3"
+    assert ResolveAPI._lua_literal(2.5) == "2.5"
+    assert ResolveAPI._lua_literal("plain") == '"plain"'
+    assert ResolveAPI._lua_literal('a"b\\c\nd') == '"a\\"b\\\\c\\nd"'
+    assert ResolveAPI._lua_literal(None) is None
+    assert ResolveAPI._lua_literal(object()) is None
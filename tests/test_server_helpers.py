@@ -0,0 +1,60 @@
+import pytest
+
+server = pytest.importorskip("davinci_resolve_mcp.server")
+
+
+@pytest.fixture(autouse=True)
+def clear_listing_cache():
+    server._LISTING_CACHE.clear()
+    yield
+    server._LISTING_CACHE.clear()
+
+
+def test_listing_handle_round_trip() -> None:
+    lines = [f"line {i}" for i in range(50)]
+    handle = server._store_listing(lines)
+
+    page = server.fetch_listing_page(handle, offset=20, limit=5)
+    assert page == "line 20\nline 21\nline 22\nline 23\nline 24\n[showing 20-24 of 50]"
+
+    # A short final page stops at the end of the listing.
+    page = server.fetch_listing_page(handle, offset=48, limit=5)
+    assert page == "line 48\nline 49\n[showing 48-49 of 50]"
+
+
+def test_fetch_listing_page_validation() -> None:
+    handle = server._store_listing(["only line"])
+
+    assert "Unknown or expired" in server.fetch_listing_page("missing")
+    assert "Offset must be >= 0" in server.fetch_listing_page(handle, offset=-1)
+    assert "limit must be >= 1" in server.fetch_listing_page(handle, limit=0)
+    assert "past the end" in server.fetch_listing_page(handle, offset=1)
+
+
+def test_listing_cache_eviction() -> None:
+    handles = [server._store_listing([f"listing {i}"]) for i in range(server._LISTING_CACHE_MAX)]
+    assert len(server._LISTING_CACHE) == server._LISTING_CACHE_MAX
+
+    # Storing one more evicts the oldest entry and only the oldest.
+    newest = server._store_listing(["one too many"])
+    assert len(server._LISTING_CACHE) == server._LISTING_CACHE_MAX
+    assert handles[0] not in server._LISTING_CACHE
+    assert all(handle in server._LISTING_CACHE for handle in handles[1:])
+    assert server._LISTING_CACHE[newest] == ["one too many"]
+
+
+def test_ttl_cache_serves_until_invalidated() -> None:
+    calls = []
+
+    @server._ttl_cache(60.0)
+    def counting() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert counting() == 1
+    assert counting() == 1
+    assert len(calls) == 1
+
+    # _invalidate_handles clears every registered resource cache.
+    server._invalidate_handles()
+    assert counting() == 2